@@ -10,6 +10,8 @@ This module provides the :class:`Backend <.Backend>` class which allows to
 run operation for a backend.
 
 """
+from collections import defaultdict
+
 from haproxyadmin.utils import (calculate, cmd_across_all_procs,
                                 compare_values, converter)
 from haproxyadmin.server import Server
@@ -57,6 +59,7 @@ BACKEND_METRICS = [
     'wredis',
     'wretr',
 ]
+BACKEND_METRICS_SET = frozenset(BACKEND_METRICS)
 
 
 class Backend(object):
@@ -70,6 +73,10 @@ class Backend(object):
     def __init__(self, backend_per_proc):
         self._backend_per_proc = backend_per_proc
         self._name = self._backend_per_proc[0].name
+        # Name and process number of a backend never change for the lifetime
+        # of the object, so compute them once. Proxy ID isn't cached as it can
+        # change when HAProxy configuration is reloaded.
+        self._process_nb = [x.process_nb for x in self._backend_per_proc]
 
     # built-in comparison operator is adjusted
     def __eq__(self, other):
@@ -109,13 +116,12 @@ class Backend(object):
         # process.
         # key: name of the server
         # value: a list of _Server object
-        servers_across_hap_processes = {}
+        servers_across_hap_processes = defaultdict(list)
 
         # Get a list of servers (_Server objects) per process
-        for backend in self._backend_per_proc:
-            for server in backend.servers(name):
-                if server.name not in servers_across_hap_processes:
-                    servers_across_hap_processes[server.name] = []
+        results = cmd_across_all_procs(self._backend_per_proc, 'servers', name)
+        for _, servers in results:
+            for server in servers:
                 servers_across_hap_processes[server.name].append(server)
 
         # For each server build a Server object
@@ -132,13 +138,29 @@ class Backend(object):
         :return: :class:`Server <Server>` object
         :rtype: haproxyadmin.Server
         """
-        server = self.servers(name)
-        if len(server) == 1:
-            return server[0]
-        elif len(server) == 0:
+        server_per_proc = self._collect_server_per_proc(name)
+        if not server_per_proc:
             raise ValueError("Could not find server")
-        else:
-            raise ValueError("Found more than one server, this is a bug!")
+
+        return Server(server_per_proc, self.name)
+
+    def _collect_server_per_proc(self, name):
+        """Return the :class:`._Server` objects of a server across processes.
+
+        Server names are unique within a backend, thus each process returns
+        at most one object and there is no need to group them by name.
+
+        :param name: Name of the server
+        :type name: string
+        :return: A list of :class:`._Server` objects
+        :rtype: list
+        """
+        server_per_proc = []
+        results = cmd_across_all_procs(self._backend_per_proc, 'servers', name)
+        for _, servers in results:
+            server_per_proc.extend(servers)
+
+        return server_per_proc
 
     def metric(self, name):
         """Return the value of a metric.
@@ -154,13 +176,20 @@ class Backend(object):
         :rtype: number, either ``integer`` or ``float``.
         :raise: ValueError when a given metric is not found.
         """
-        metrics = []
-        if name not in BACKEND_METRICS:
+        if name not in BACKEND_METRICS_SET:
             raise ValueError("{} is not valid metric".format(name))
 
-        metrics = [x.metric(name) for x in self._backend_per_proc]
-        metrics[:] = (converter(x) for x in metrics)
-        metrics[:] = (x for x in metrics if x is not None)
+        return self._metric_unchecked(name)
+
+    def _metric_unchecked(self, name):
+        """Return the value of a metric without validating its name.
+
+        Used by properties which pass a metric name known to be valid.
+        """
+        values = cmd_across_all_procs(self._backend_per_proc, 'metric', name)
+        _converter = converter
+        metrics = [x for x in (_converter(y[1]) for y in values)
+                   if x is not None]
 
         return calculate(name, metrics)
 
@@ -178,11 +207,7 @@ class Backend(object):
 
         :rtype: list
         """
-        process_numbers = []
-        for backend in self._backend_per_proc:
-            process_numbers.append(backend.process_nb)
-
-        return process_numbers
+        return list(self._process_nb)
 
     @property
     def requests(self):
@@ -190,7 +215,7 @@ class Backend(object):
 
         :rtype: integer
         """
-        return self.metric('stot')
+        return self._metric_unchecked('stot')
 
     def requests_per_process(self):
         """Return the number of requests for the backend per process.
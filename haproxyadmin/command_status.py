@@ -8,6 +8,8 @@ haproxyadmin.command_status.py
 This module categorizes the output returned by various commands
 
 """
+import re
+
 # CLI doesn't return a message if operation is successfully executed.
 # But, versions prior 1.5.10 was returning 'Done.' message only for ACL/MAPs
 # operations. 73f1d8f447087 commit in haproxy-1.5 makes the output consistent
@@ -16,6 +18,7 @@ SUCCESS_OUTPUT_STRINGS = [
     'Done.',
     ''
 ]
+SUCCESS_OUTPUT_SET = frozenset(SUCCESS_OUTPUT_STRINGS)
 
 ERROR_OUTPUT_STRINGS = [
     "'add acl' expects two parameters: ACL identifier and pattern.",
@@ -101,8 +104,32 @@ ERROR_OUTPUT_STRINGS = [
     "Can't find resolvers section.",
     "Can't find backend.",
 ]
+ERROR_OUTPUT_SET = frozenset(ERROR_OUTPUT_STRINGS)
+
+SUCCESS_ADDRESS_RE = re.compile(r"IP changed from|no need to change the addr")
+SUCCESS_PORT_RE = re.compile(r"no need to change the addr, port changed from|"
+                             r"no need to change the addr, no need to change "
+                             r"the port")
+SUCCESS_STRING_ADDRESS = SUCCESS_ADDRESS_RE.pattern
+SUCCESS_STRING_PORT = SUCCESS_PORT_RE.pattern
+
+OUTPUT_SUCCESS = 'success'
+OUTPUT_ERROR = 'error'
+OUTPUT_UNKNOWN = 'unknown'
+
+
+def classify(output):
+    """Categorize a single line of output returned by HAProxy.
 
-SUCCESS_STRING_ADDRESS = "IP changed from|no need to change the addr"
-SUCCESS_STRING_PORT = ("no need to change the addr, port changed from|no need "
-                       "to change the addr, no need to change the port"
-                      )
+    :param output: a line of output returned by a command.
+    :type output: ``string``
+    :return: :data:`OUTPUT_SUCCESS`, :data:`OUTPUT_ERROR` or
+      :data:`OUTPUT_UNKNOWN`.
+    :rtype: ``string``
+    """
+    if output in SUCCESS_OUTPUT_SET:
+        return OUTPUT_SUCCESS
+    elif output in ERROR_OUTPUT_SET:
+        return OUTPUT_ERROR
+    else:
+        return OUTPUT_UNKNOWN
@@ -11,7 +11,8 @@ be used to run operations on a frontend and retrieve statistics.
 
 """
 from haproxyadmin.utils import (calculate, cmd_across_all_procs, converter,
-                                check_command, should_die, compare_values)
+                                check_command, should_die, compare_values,
+                                ttl_cached)
 
 
 FRONTEND_METRICS = [
@@ -41,34 +42,71 @@ FRONTEND_METRICS = [
     'smax',
     'stot',
 ]
+FRONTEND_METRICS_SET = frozenset(FRONTEND_METRICS)
 
 
 class Frontend(object):
     """Build a user-created :class:`Frontend` for a single frontend.
 
+    When ``cache_ttl`` is set, values returned by :meth:`metric` and
+    :attr:`status` are cached for that many seconds, so reading several
+    properties in a row doesn't query HAProxy for each one of them. The cache is cleared when a command
+    is sent to the frontend.
+
     :param frontend_per_proc: list of :class:`._Frontend` objects.
     :type frontend_per_proc: ``list``
+    :param cache_ttl: (optional) seconds to cache metric values for, 0
+      disables caching (defaults to 0).
+    :type cache_ttl: ``float``
     :rtype: a :class:`Frontend`.
     """
+    __slots__ = ('_frontend_per_proc', '_name', '_process_nb', '_ttl',
+                 '_metric_cache', '_cmd_disable', '_cmd_enable',
+                 '_cmd_setmaxconn', '_cmd_shutdown')
 
-    def __init__(self, frontend_per_proc):
+    def __init__(self, frontend_per_proc, cache_ttl=0):
         self._frontend_per_proc = frontend_per_proc
         self._name = self._frontend_per_proc[0].name
+        # Proxy ID isn't cached as it can change when HAProxy configuration
+        # is reloaded.
+        self._process_nb = [x.process_nb for x in self._frontend_per_proc]
+        self._ttl = cache_ttl
+        # key: metric name
+        # value: a tuple of the time the value was retrieved and the value
+        self._metric_cache = {}
+        # Commands only depend on the name of the frontend, which never
+        # changes, so build them once.
+        self._cmd_disable = "disable frontend {}".format(self._name)
+        self._cmd_enable = "enable frontend {}".format(self._name)
+        self._cmd_setmaxconn = "set maxconn frontend {} ".format(self._name)
+        self._cmd_shutdown = "shutdown frontend {}".format(self._name)
 
     # built-in comparison operator is adjusted to support
     # if 'x' in list_of_frontend_obj
     # x == frontend_obj
     def __eq__(self, other):
-        if isinstance(other, Frontend):
-            return (self.name == other.name)
+        # Exact type checks are cheaper than isinstance() and cover the
+        # common cases, subclasses fall through to isinstance().
+        other_type = type(other)
+        if other_type is Frontend:
+            return (self._name == other._name)
+        elif other_type is str:
+            return (self._name == other)
+        elif isinstance(other, Frontend):
+            return (self._name == other._name)
         elif isinstance(other, str):
-            return (self.name == other)
+            return (self._name == other)
         else:
             return False
 
     def __ne__(self, other):
         return (not self.__eq__(other))
 
+    # hash of the name keeps objects, which are equal to their names,
+    # usable as keys in sets and dictionaries.
+    def __hash__(self):
+        return hash(self._name)
+
     @property
     def iid(self):
         """Return the unique proxy ID of the frontend.
@@ -95,8 +133,9 @@ class Frontend(object):
           when something bad happens otherwise returns ``False``.
 
         """
-        cmd = "disable frontend {}".format(self.name)
-        results = cmd_across_all_procs(self._frontend_per_proc, 'command', cmd)
+        results = cmd_across_all_procs(self._frontend_per_proc, 'command',
+                                       self._cmd_disable)
+        self.invalidate()
 
         return check_command(results)
 
@@ -113,8 +152,9 @@ class Frontend(object):
           :class:`haproxyadmin.exceptions.MultipleCommandResults` is raised
           when something bad happens otherwise returns ``False``.
         """
-        cmd = "enable frontend {}".format(self.name)
-        results = cmd_across_all_procs(self._frontend_per_proc, 'command', cmd)
+        results = cmd_across_all_procs(self._frontend_per_proc, 'command',
+                                       self._cmd_enable)
+        self.invalidate()
 
         return check_command(results)
 
@@ -132,22 +172,82 @@ class Frontend(object):
         :rtype: ``integer``
         :raise: ``ValueError`` when a given metric is not found
         """
-        if name not in FRONTEND_METRICS:
+        if name not in FRONTEND_METRICS_SET:
             raise ValueError("{} is not valid metric".format(name))
 
-        metrics = [x.metric(name) for x in self._frontend_per_proc]
-        metrics[:] = (converter(x) for x in metrics)
-        metrics[:] = (x for x in metrics if x is not None)
+        return self._metric_unchecked(name)
+
+    def _metric_unchecked(self, name):
+        """Return the value of a metric without validating its name.
+
+        Used by properties which pass a metric name known to be valid.
+        """
+        return ttl_cached(self._metric_cache, name, self._ttl,
+                          lambda: self._fetch_metric(name))
+
+    def _fetch_metric(self, name):
+        """Return the value of a metric without using the cache."""
+        values = cmd_across_all_procs(self._frontend_per_proc, 'metric', name)
+        _converter = converter
+        metrics = [x for x in (_converter(y[1]) for y in values)
+                   if x is not None]
 
         return calculate(name, metrics)
 
+    def invalidate(self):
+        """Clear cached metric values.
+
+        Next call to :meth:`metric` or to a property which returns a metric
+        retrieves the value from HAProxy.
+        """
+        self._metric_cache.clear()
+
+    def batch_metrics(self, names):
+        """Return the values of several metrics.
+
+        All metrics of a frontend are reported in a single line of the
+        statistics, thus the statistics are fetched only once per HAProxy
+        process regardless the number of metrics requested. The same
+        calculation as in :meth:`metric` is performed for each metric.
+
+        :param names: metric names to retrieve
+        :type names: an iterable of
+          :data:`haproxyadmin.haproxy.FRONTEND_METRICS`
+        :return: metric name as key and the value of the metric as value
+        :rtype: ``dict``
+        :raise: ``ValueError`` when a given metric is not found
+
+        Usage::
+
+          >>> from haproxyadmin import haproxy
+          >>> hap = haproxy.HAProxy(socket_dir='/run/haproxy')
+          >>> frontend = hap.frontend('frontend2_proc34')
+          >>> frontend.batch_metrics(['scur', 'req_tot'])
+          {'scur': 0, 'req_tot': 5}
+        """
+        names = tuple(names)
+        for name in names:
+            if name not in FRONTEND_METRICS_SET:
+                raise ValueError("{} is not valid metric".format(name))
+
+        results = cmd_across_all_procs(self._frontend_per_proc, 'metrics',
+                                       names)
+        _converter = converter
+        values = {}
+        for name in names:
+            metrics = [x for x in (_converter(y[1][name]) for y in results)
+                       if x is not None]
+            values[name] = calculate(name, metrics)
+
+        return values
+
     @property
     def maxconn(self):
         """Return the configured maximum connection allowed for frontend.
 
         :rtype: ``integer``
         """
-        return self.metric('slim')
+        return self._metric_unchecked('slim')
 
     @should_die
     def setmaxconn(self, value):
@@ -178,8 +278,9 @@ class Frontend(object):
         if not isinstance(value, int):
             raise ValueError("Expected integer and got {}".format(type(value)))
 
-        cmd = "set maxconn frontend {} {}".format(self.name, value)
+        cmd = self._cmd_setmaxconn + str(value)
         results = cmd_across_all_procs(self._frontend_per_proc, 'command', cmd)
+        self.invalidate()
 
         return check_command(results)
 
@@ -205,11 +306,7 @@ class Frontend(object):
           >>> frontend.process_nb
           [4, 3]
         """
-        process_numbers = []
-        for frontend in self._frontend_per_proc:
-            process_numbers.append(frontend.process_nb)
-
-        return process_numbers
+        return list(self._process_nb)
 
     @property
     def requests(self):
@@ -225,7 +322,7 @@ class Frontend(object):
           >>> frontend.requests
           5
         """
-        return self.metric('req_tot')
+        return self._metric_unchecked('req_tot')
 
     def requests_per_process(self):
         """Return the number of requests for the frontend per process.
@@ -260,8 +357,9 @@ class Frontend(object):
 
         :rtype: ``bool``
         """
-        cmd = "shutdown frontend {}".format(self.name)
-        results = cmd_across_all_procs(self._frontend_per_proc, 'command', cmd)
+        results = cmd_across_all_procs(self._frontend_per_proc, 'command',
+                                       self._cmd_shutdown)
+        self.invalidate()
 
         return check_command(results)
 
@@ -296,6 +394,11 @@ class Frontend(object):
           >>> frontend.status
           'OPEN'
         """
+        return ttl_cached(self._metric_cache, 'status', self._ttl,
+                          self._fetch_status)
+
+    def _fetch_status(self):
+        """Return the status of the frontend without using the cache."""
         results = cmd_across_all_procs(self._frontend_per_proc, 'metric',
                                        'status')
 
@@ -10,13 +10,18 @@ This module implements the main haproxyadmin API.
 
 """
 import os
-import glob
+import stat
+from collections import defaultdict
+from itertools import chain
+
+import six
 
 from haproxyadmin.frontend import Frontend
 from haproxyadmin.backend import Backend
-from haproxyadmin.utils import (is_unix_socket, cmd_across_all_procs, converter,
-                                calculate, isint, should_die, check_command,
-                                check_output, compare_values, connected_socket)
+from haproxyadmin.utils import (cmd_across_all_procs, converter, calculate,
+                                isint, should_die, check_command,
+                                check_output, compare_values, connected_socket,
+                                connected_sockets, ttl_cached, unix_sockets)
 from haproxyadmin.internal.haproxy import _HAProxyProcess
 from haproxyadmin.exceptions import CommandFailed
 
@@ -63,6 +68,52 @@ HAPROXY_METRICS = [
     'MaxSslRate',
     'MaxSessRate',
 ]
+HAPROXY_METRICS_SET = frozenset(HAPROXY_METRICS)
+
+
+def _acl_map_ref(value):
+    """Return the reference of an ACL or a MAP as it is used in commands.
+
+    IDs are prefixed with '#' and files are returned as they are.
+    """
+    # Files are usually absolute paths, which can't be IDs, so skip the
+    # int() conversion and the exception it raises for them.
+    if isinstance(value, six.string_types) and value[:1] == '/':
+        return value
+    if isint(value):
+        return '#' + str(value)
+
+    return value
+
+
+def _key_ref(key):
+    """Return the key of an ACL or a MAP entry as it is used in commands.
+
+    Entries can be referenced by their ID as reported by show_acl() and
+    show_map(), which is prefixed with '#'.
+    """
+    if isinstance(key, six.string_types) and key[:2] == '0x':
+        return '#' + key
+
+    return key
+
+
+def _list_output(output):
+    """Return the output of a command which dumps a list.
+
+    :param output: output of the command.
+    :type output: ``list``
+    :return: the output or an empty list if command returned nothing.
+    :rtype: ``list``
+    :raise: :class:`.CommandFailed` when output contains an error.
+    """
+    first_line = output[0]
+    if len(output) == 1 and not first_line:
+        return []
+    if not check_output(output):
+        raise CommandFailed(first_line)
+
+    return output
 
 
 class HAProxy(object):
@@ -87,13 +138,33 @@ class HAProxy(object):
       - 1..N => times to retry
 
     :type retry: ``integer`` or ``None``
-    :param retry_interval: sleep time between the retries.
+    :param retry_interval: sleep time between the retries, it is doubled
+      after every retry and a random jitter of up to 50% is subtracted.
     :type retry_interval: ``integer``
     :param timeout: timeout for the connection
     :type timeout: ``float``
+    :param keep_alive: keep a connection open to each stats socket and reuse
+      it for all commands instead of opening a new connection per command.
+      Each connection occupies one of the connection slots of the stats
+      socket (``maxconn`` setting of ``stats socket`` directive).
+    :type keep_alive: ``bool``
+    :param pool_size: maximum number of idle connections to keep open per
+      stats socket when ``keep_alive`` is ``True``. More than one is only
+      useful when the object is used by multiple threads.
+    :type pool_size: ``integer``
+    :param max_backoff: maximum sleep time between the retries.
+    :type max_backoff: ``integer``
+    :param cache_ttl: (optional) seconds to cache the objects returned by
+      :meth:`frontends` and :meth:`backends`, the output of 'show info',
+      which all process-wide metrics and settings are read from, and the
+      metrics of :class:`Frontend <haproxyadmin.frontend.Frontend>`
+      objects, 0 disables caching (defaults to 0).
+    :type cache_ttl: ``float``
     :return: a user-created :class:`HAProxy` object.
     :rtype: :class:`HAProxy`
     """
+    __slots__ = ('_hap_processes', '_ttl', '_frontends_cache',
+                 '_backends_cache')
 
     def __init__(self,
                  socket_dir=None,
@@ -101,9 +172,17 @@ class HAProxy(object):
                  retry=2,
                  retry_interval=2,
                  timeout=1,
+                 keep_alive=False,
+                 pool_size=1,
+                 max_backoff=30,
+                 cache_ttl=0,
                  ):
 
-        self._hap_processes = []
+        self._ttl = cache_ttl
+        # key: name passed to frontends()/backends()
+        # value: a tuple of the time the list was built and the list
+        self._frontends_cache = {}
+        self._backends_cache = {}
         socket_files = []
 
         if socket_dir:
@@ -111,14 +190,24 @@ class HAProxy(object):
                 raise ValueError("socket directory does not exist "
                                  "{}".format(socket_dir))
 
-            for _file in glob.glob(os.path.join(socket_dir, '*')):
-                if is_unix_socket(_file) and connected_socket(_file, timeout):
-                    socket_files.append(_file)
-        elif (socket_file and not os.path.exists(socket_file)):
-            raise ValueError("{} UNIX socket file was not found".format(socket_file))
-        elif (socket_file and os.path.exists(socket_file) and is_unix_socket(socket_file) and
-              connected_socket(socket_file, timeout)):
-            socket_files.append(os.path.realpath(socket_file))
+            socket_files = connected_sockets(unix_sockets(socket_dir),
+                                             timeout)
+        elif socket_file:
+            # a single stat() tells if file exists and if it is a socket
+            try:
+                mode = os.stat(socket_file).st_mode
+            except OSError:
+                raise ValueError("{} UNIX socket file was not found"
+                                 .format(socket_file))
+            if not (stat.S_ISSOCK(mode) and
+                    connected_socket(socket_file, timeout)):
+                raise ValueError("UNIX socket file was not set")
+            # resolving symlinks is only needed when the path isn't already
+            # the absolute path of the socket.
+            if os.path.isabs(socket_file) and not os.path.islink(socket_file):
+                socket_files.append(socket_file)
+            else:
+                socket_files.append(os.path.realpath(socket_file))
         else:
             raise ValueError("UNIX socket file was not set")
 
@@ -126,15 +215,51 @@ class HAProxy(object):
             raise ValueError("No valid UNIX socket file was found, directory: "
                              "{} file: {}".format(socket_dir, socket_file))
 
-        for so_file in socket_files:
-            self._hap_processes.append(
-                _HAProxyProcess(
-                    socket_file=so_file,
-                    retry=retry,
-                    retry_interval=retry_interval,
-                    timeout=timeout
-                 )
+        # list of processes never changes, so store it as a tuple
+        self._hap_processes = tuple(
+            _HAProxyProcess(
+                socket_file=so_file,
+                retry=retry,
+                retry_interval=retry_interval,
+                max_backoff=max_backoff,
+                timeout=timeout,
+                keep_alive=keep_alive,
+                pool_size=pool_size,
+                cache_ttl=cache_ttl,
             )
+            for so_file in socket_files
+        )
+
+    def close(self):
+        """Close persistent connections to HAProxy processes.
+
+        Only applicable when object was created with ``keep_alive`` set to
+        ``True``, a new connection is opened by the next command.
+
+        Call it after HAProxy is reloaded, otherwise open connections keep
+        talking to the old processes until they exit or ``stats timeout``
+        expires, see :meth:`invalidate` for the cached data.
+        """
+        for hap_process in self._hap_processes:
+            hap_process.close()
+
+    def invalidate(self):
+        """Clear cached frontend and backend objects and process information.
+
+        Next call to :meth:`frontends` or :meth:`backends` queries HAProxy.
+        """
+        self._frontends_cache.clear()
+        self._backends_cache.clear()
+        self.refresh_info()
+
+    def refresh_info(self):
+        """Clear cached process information.
+
+        Next call to :meth:`info`, :meth:`metric` or to a property which
+        returns process information runs 'show info' on HAProxy.
+        """
+        for hap_process in self._hap_processes:
+            hap_process.invalidate()
 
     @should_die
     def add_acl(self, acl, pattern):
@@ -158,10 +283,7 @@ class HAProxy(object):
           >>> hap.show_acl(acl=4)
           ['0x23181c0 /static/css/', '0x238f790 /foo/']
         """
-        if isint(acl):
-            cmd = "add acl #{} {}".format(acl, pattern)
-        else:
-            cmd = "add acl {} {}".format(acl, pattern)
+        cmd = "add acl {} {}".format(_acl_map_ref(acl), pattern)
 
         results = cmd_across_all_procs(self._hap_processes, 'command',
                                        cmd)
@@ -192,16 +314,89 @@ class HAProxy(object):
           >>> hap.show_map(0)
           ['0x1a78b20 1 www.foo.com-1', '0x1b15c80 9 foo']
         """
-        if isint(mapid):
-            cmd = "add map #{} {} {}".format(mapid, key, value)
-        else:
-            cmd = "add map {} {} {}".format(mapid, key, value)
+        cmd = "add map {} {} {}".format(_acl_map_ref(mapid), key, value)
 
         results = cmd_across_all_procs(self._hap_processes, 'command',
                                        cmd)
 
         return check_command(results)
 
+    def bulk_acl(self, acl):
+        """Build a function to add many entries into the acl.
+
+        Unlike :meth:`add_acl` the command prefix is built once, which
+        matters when thousands of entries are loaded.
+
+        :param acl: acl id or a file.
+        :type acl: ``integer`` or a file path passed as ``string``
+        :return: a function which accepts a pattern, adds it into the acl
+          and returns ``True`` if command succeeds. It raises
+          :class:`haproxyadmin.exceptions.CommandFailed` or
+          :class:`haproxyadmin.exceptions.MultipleCommandResults` when
+          something bad happens.
+        :rtype: ``function``
+
+        Usage::
+
+          >>> from haproxyadmin import haproxy
+          >>> hap = haproxy.HAProxy(socket_dir='/run/haproxy')
+          >>> add = hap.bulk_acl(acl=4)
+          >>> for pattern in ('/foo/', '/bar/'):
+          ...     add(pattern)
+          ...
+          True
+          True
+        """
+        prefix = "add acl {} ".format(_acl_map_ref(acl))
+        hap_processes = self._hap_processes
+
+        def add_acl(pattern):
+            results = cmd_across_all_procs(hap_processes, 'command',
+                                           "{}{}".format(prefix, pattern))
+
+            return check_command(results)
+
+        return add_acl
+
+    def bulk_map(self, mapid):
+        """Build a function to set the value of many keys in the map.
+
+        Unlike :meth:`set_map` the command prefix is built once, which
+        matters when thousands of keys are loaded.
+
+        :param mapid: map id or a file.
+        :type mapid: ``integer`` or a file path passed as ``string``
+        :return: a function which accepts a key and a value, sets the value
+          of the key in the map and returns ``True`` if command succeeds. It
+          raises :class:`haproxyadmin.exceptions.CommandFailed` or
+          :class:`haproxyadmin.exceptions.MultipleCommandResults` when
+          something bad happens.
+        :rtype: ``function``
+
+        Usage::
+
+          >>> from haproxyadmin import haproxy
+          >>> hap = haproxy.HAProxy(socket_dir='/run/haproxy')
+          >>> set_map = hap.bulk_map(0)
+          >>> for key, value in (('11', 'new'), ('22', 'new')):
+          ...     set_map(key, value)
+          ...
+          True
+          True
+        """
+        prefix = "set map {} ".format(_acl_map_ref(mapid))
+        hap_processes = self._hap_processes
+
+        def set_map(key, value):
+            results = cmd_across_all_procs(
+                hap_processes, 'command',
+                "{}{} {}".format(prefix, _key_ref(key), value)
+            )
+
+            return check_command(results)
+
+        return set_map
+
     @should_die
     def clear_acl(self, acl):
         """Remove all entries from a acl.
@@ -220,10 +415,7 @@ class HAProxy(object):
           >>> hap.clear_acl(acl='/etc/haproxy/bl_frontend')
           True
         """
-        if isint(acl):
-            cmd = "clear acl #{}".format(acl)
-        else:
-            cmd = "clear acl {}".format(acl)
+        cmd = "clear acl {}".format(_acl_map_ref(acl))
 
         results = cmd_across_all_procs(self._hap_processes, 'command',
                                        cmd)
@@ -248,10 +440,7 @@ class HAProxy(object):
           >>> hap.clear_map(mapid='/etc/haproxy/bl_frontend')
           True
         """
-        if isint(mapid):
-            cmd = "clear map #{}".format(mapid)
-        else:
-            cmd = "clear map {}".format(mapid)
+        cmd = "clear map {}".format(_acl_map_ref(mapid))
 
         results = cmd_across_all_procs(self._hap_processes, 'command',
                                        cmd)
@@ -278,6 +467,7 @@ class HAProxy(object):
 
         results = cmd_across_all_procs(self._hap_processes, 'command',
                                        cmd)
+        self.invalidate()
 
         return check_command(results)
 
@@ -314,7 +504,9 @@ class HAProxy(object):
           >>> hap.processids
           [22029, 22028, 22027, 22026]
         """
-        return [x.metric('Pid') for x in self._hap_processes]
+        values = cmd_across_all_procs(self._hap_processes, 'pid')
+
+        return [x[1] for x in values]
 
     @should_die
     def del_acl(self, acl, key):
@@ -342,13 +534,7 @@ class HAProxy(object):
           >>> hap.show_acl(acl=4)
           ['0x238f810 /bar/']
         """
-        if key.startswith('0x'):
-            key = "#{}".format(key)
-
-        if isint(acl):
-            cmd = "del acl #{} {}".format(acl, key)
-        else:
-            cmd = "del acl {} {}".format(acl, key)
+        cmd = "del acl {} {}".format(_acl_map_ref(acl), _key_ref(key))
 
         results = cmd_across_all_procs(self._hap_processes, 'command',
                                        cmd)
@@ -385,13 +571,7 @@ class HAProxy(object):
           >>> hap.show_map(0)
           ['0x1a78980 11 bar']
         """
-        if key.startswith('0x'):
-            key = "#{}".format(key)
-
-        if isint(mapid):
-            cmd = "del map #{} {}".format(mapid, key)
-        else:
-            cmd = "del map {} {}".format(mapid, key)
+        cmd = "del map {} {}".format(_acl_map_ref(mapid), _key_ref(key))
 
         results = cmd_across_all_procs(self._hap_processes, 'command',
                                        cmd)
@@ -430,23 +610,27 @@ class HAProxy(object):
         :return: list of :class:`Frontend <haproxyadmin.frontend.Frontend>`.
         :rtype: ``list``
         """
+        return list(ttl_cached(self._frontends_cache, name, self._ttl,
+                               lambda: self._build_frontends(name)))
+
+    def _build_frontends(self, name):
+        """Build the list for :meth:`frontends` without the cache."""
         return_list = []
 
         # store _Frontend objects for each frontend per haproxy process.
         # key: name of the frontend
         # value: a list of _Frontend objects
-        frontends_across_hap_processes = {}
+        frontends_across_hap_processes = defaultdict(list)
 
-        # loop over all haproxy processes and get a list of frontend objects
-        for haproxy in self._hap_processes:
-            for frontend in haproxy.frontends(name):
-                if frontend.name not in frontends_across_hap_processes:
-                    frontends_across_hap_processes[frontend.name] = []
+        # query all haproxy processes and get a list of frontend objects
+        results = cmd_across_all_procs(self._hap_processes, 'frontends', name)
+        for _, frontends in results:
+            for frontend in frontends:
                 frontends_across_hap_processes[frontend.name].append(frontend)
 
         # build the returned list
         for value in frontends_across_hap_processes.values():
-            return_list.append(Frontend(value))
+            return_list.append(Frontend(value, cache_ttl=self._ttl))
 
         return return_list
 
@@ -491,13 +675,10 @@ class HAProxy(object):
           >>> hap.get_acl(acl=4, value='/static/js/')
           'type=beg, case=sensitive, match=yes, idx=tree, pattern="/static/js/"'
         """
-        if isint(acl):
-            cmd = "get acl #{} {}".format(acl, value)
-        else:
-            cmd = "get acl {} {}".format(acl, value)
+        cmd = "get acl {} {}".format(_acl_map_ref(acl), value)
 
-        get_results = cmd_across_all_procs(self._hap_processes, 'command', cmd)
-        get_info_proc1 = get_results[0][1]
+        # ACL can't be different per process thus we only ask the 1st one.
+        get_info_proc1 = self._hap_processes[0].command(cmd)
         if not check_output(get_info_proc1):
             raise ValueError(get_info_proc1)
 
@@ -525,14 +706,10 @@ class HAProxy(object):
           >>> hap.get_map(0, '10')
           'type=str, case=sensitive, found=no'
         """
-        if isint(mapid):
-            cmd = "get map #{} {}".format(mapid, value)
-        else:
-            cmd = "get map {} {}".format(mapid, value)
+        cmd = "get map {} {}".format(_acl_map_ref(mapid), value)
 
-        get_results = cmd_across_all_procs(self._hap_processes, 'command',
-                                           cmd)
-        get_info_proc1 = get_results[0][1]
+        # map can't be different per process thus we only ask the 1st one.
+        get_info_proc1 = self._hap_processes[0].command(cmd)
         if not check_output(get_info_proc1):
             raise CommandFailed(get_info_proc1[0])
 
@@ -544,12 +721,10 @@ class HAProxy(object):
         :return: A list of ``dict`` for each process.
         :rtype: ``list``
         """
-        return_list = []
+        results = cmd_across_all_procs(self._hap_processes, 'proc_info')
 
-        for haproxy in self._hap_processes:
-            return_list.append(haproxy.proc_info())
-
-        return return_list
+        # copy them as they may be cached
+        return [dict(x[1]) for x in results]
 
     @property
     def maxconn(self):
@@ -578,9 +753,9 @@ class HAProxy(object):
         :rtype: ``list``
         """
         ret = []
-        for backend in self.backends(backend):
+        for backend_obj in self.backends(backend):
             try:
-                ret.append(backend.server(hostname))
+                ret.append(backend_obj.server(hostname))
             except ValueError:
                 # lookup for an nonexistent server in backend raise VauleError
                 # catch and pass as we query all backends
@@ -601,12 +776,8 @@ class HAProxy(object):
         :return: A list of :class:`Server <Server>` objects
         :rtype: ``list``.
         """
-        return_list = []
-        for backend in self.backends(backend):
-            servers = backend.servers()
-            return_list += servers
-
-        return return_list
+        return list(chain.from_iterable(x.servers()
+                                        for x in self.backends(backend)))
 
     def metric(self, name):
         """Return the value of a metric.
@@ -622,12 +793,12 @@ class HAProxy(object):
         :rtype: ``integer``
         :raise: ``ValueError`` when a given metric is not found
         """
-        if name not in HAPROXY_METRICS:
+        if name not in HAPROXY_METRICS_SET:
             raise ValueError("{} is not valid metric".format(name))
 
-        metrics = [x.metric(name) for x in self._hap_processes]
-        metrics[:] = (converter(x) for x in metrics)
-        metrics[:] = (x for x in metrics if x is not None)
+        values = cmd_across_all_procs(self._hap_processes, 'metric', name)
+        metrics = [x for x in (converter(y[1]) for y in values)
+                   if x is not None]
 
         return calculate(name, metrics)
 
@@ -639,19 +810,23 @@ class HAProxy(object):
         :return: list of :class:`Backend <haproxyadmin.backend.Backend>`.
         :rtype: ``list``
         """
+        return list(ttl_cached(self._backends_cache, name, self._ttl,
+                               lambda: self._build_backends(name)))
+
+    def _build_backends(self, name):
+        """Build the list for :meth:`backends` without the cache."""
         return_list = []
 
         # store _Backend objects for each backend per haproxy process.
         # key: name of the backend
         # value: a list of _Backend objects
-        backends_across_hap_processes = {}
+        backends_across_hap_processes = defaultdict(list)
 
-        # loop over all HAProxy processes and get a set of backends
-        for hap_process in self._hap_processes:
+        # query all HAProxy processes and get a set of backends
+        results = cmd_across_all_procs(self._hap_processes, 'backends', name)
+        for _, backends in results:
             # Returns object _Backend
-            for backend in hap_process.backends(name):
-                if backend.name not in backends_across_hap_processes:
-                    backends_across_hap_processes[backend.name] = []
+            for backend in backends:
                 backends_across_hap_processes[backend.name].append(backend)
 
         # build the returned list
@@ -704,7 +879,16 @@ class HAProxy(object):
           >>> hap.requests
           457
         """
-        return sum([x.requests for x in self.frontends()])
+        # Statistics of all frontends of a process are retrieved at once,
+        # rather than building Frontend objects and querying each one.
+        results = cmd_across_all_procs(self._hap_processes, 'frontends_stats')
+        _converter = converter
+        metrics = [x for x in (_converter(y.req_tot)
+                               for _, frontends in results
+                               for y in frontends.values())
+                   if x is not None]
+
+        return calculate('req_tot', metrics)
 
     @should_die
     def set_map(self, mapid, key, value):
@@ -737,13 +921,8 @@ class HAProxy(object):
           >>> hap.show_map(0)
           ['0x1a78980 11 new2', '0x1b15c00 22 0']
         """
-        if key.startswith('0x'):
-            key = "#{}".format(key)
-
-        if isint(mapid):
-            cmd = "set map #{} {} {}".format(mapid, key, value)
-        else:
-            cmd = "set map {} {} {}".format(mapid, key, value)
+        cmd = "set map {} {} {}".format(_acl_map_ref(mapid), _key_ref(key),
+                                         value)
 
         results = cmd_across_all_procs(self._hap_processes, 'command', cmd)
 
@@ -765,6 +944,8 @@ class HAProxy(object):
         #. what the method returned
 
         :rtype: ``list``
+        :raise: ``ValueError`` when object was created with ``keep_alive``
+          set to ``True`` and the command contains a newline character
 
         Usage::
 
@@ -777,8 +958,46 @@ class HAProxy(object):
           >>> hap.show_acl(acl=4)
           ['0x23181c0 /static/css/', '0x238f790 /foo/']
         """
-        return cmd_across_all_procs(self._hap_processes,
-                                    'command', cmd, full_output=True)
+        results = cmd_across_all_procs(self._hap_processes,
+                                       'command', cmd, full_output=True)
+        # we don't know what the command changed
+        self.invalidate()
+
+        return results
+
+    @should_die
+    def commands(self, cmds):
+        """Send several commands to haproxy process in one go.
+
+        Commands are executed in the given order. When object was created
+        with ``keep_alive`` set to ``True``, they are sent over a single
+        connection to each process, otherwise each command opens its own
+        connection. Like :meth:`command` we **do not** perform any
+        sanitization on input and on output.
+
+        :param cmds: commands to send to haproxy process.
+        :type cmds: ``list``
+        :return: list of 2-item tuple
+
+        #. HAProxy process number
+        #. a list with the output of each command
+
+        :rtype: ``list``
+        :raise: ``ValueError`` when object was created with ``keep_alive``
+          set to ``True`` and a command contains a newline character
+
+        Usage::
+
+          >>> from haproxyadmin import haproxy
+          >>> hap = haproxy.HAProxy(socket_file='/run/haproxy/admin.sock')
+          >>> hap.commands(['set maxconn global 5000', 'show errors'])
+          [(1, [[], ['Total events captured on [14/Oct/2016:09:04:16.034] : 0']])]
+        """
+        results = cmd_across_all_procs(self._hap_processes, 'commands', cmds)
+        # we don't know what the commands changed
+        self.invalidate()
+
+        return results
 
     @should_die
     def setmaxconn(self, value):
@@ -801,6 +1020,7 @@ class HAProxy(object):
         cmd = "set maxconn global {}".format(value)
 
         results = cmd_across_all_procs(self._hap_processes, 'command', cmd)
+        self.refresh_info()
 
         return check_command(results)
 
@@ -819,6 +1039,7 @@ class HAProxy(object):
         cmd = "set rate-limit connections global {}".format(value)
 
         results = cmd_across_all_procs(self._hap_processes, 'command', cmd)
+        self.refresh_info()
 
         return check_command(results)
 
@@ -837,6 +1058,7 @@ class HAProxy(object):
         cmd = "set rate-limit sessions global {}".format(value)
 
         results = cmd_across_all_procs(self._hap_processes, 'command', cmd)
+        self.refresh_info()
 
         return check_command(results)
 
@@ -855,6 +1077,7 @@ class HAProxy(object):
         cmd = "set rate-limit ssl-sessions global {}".format(value)
 
         results = cmd_across_all_procs(self._hap_processes, 'command', cmd)
+        self.refresh_info()
 
         return check_command(results)
 
@@ -867,7 +1090,8 @@ class HAProxy(object):
 
         :param aclid: (optional) acl id or a file
         :type aclid: ``integer`` or a file path passed as ``string``
-        :return: a list with the acls
+        :return: a list with the acls, a new list is built on every call
+          thus it can be modified by the caller.
         :rtype: ``list``
 
         Usage::
@@ -884,27 +1108,15 @@ class HAProxy(object):
           ]
         """
         if aclid is not None:
-            if isint(aclid):
-                cmd = "show acl #{}".format(aclid)
-            else:
-                cmd = "show acl {}".format(aclid)
+            cmd = "show acl " + _acl_map_ref(aclid)
         else:
             cmd = "show acl"
 
-        acl_info = cmd_across_all_procs(self._hap_processes, 'command',
-                                        cmd,
-                                        full_output=True)
         # ACL can't be different per process thus we only return the acl
         # content found in 1st process.
-        acl_info_proc1 = acl_info[0][1]
+        acl_info_proc1 = self._hap_processes[0].command(cmd, full_output=True)
 
-        if not check_output(acl_info_proc1):
-            raise CommandFailed(acl_info_proc1[0])
-
-        if len(acl_info_proc1) == 1 and not acl_info_proc1[0]:
-            return []
-        else:
-            return acl_info_proc1
+        return _list_output(acl_info_proc1)
 
     @should_die
     def show_map(self, mapid=None):
@@ -915,7 +1127,8 @@ class HAProxy(object):
 
         :param mapid: (optional) map id or a file.
         :type mapid: ``integer`` or a file path passed as ``string``
-        :return: a list with the maps.
+        :return: a list with the maps, a new list is built on every call
+          thus it can be modified by the caller.
         :rtype: ``list``
 
         Usage::
@@ -930,26 +1143,30 @@ class HAProxy(object):
           ['0x1a78ab0 0 www.foo.com-0', '0x1a78b20 1 www.foo.com-1']
         """
         if mapid is not None:
-            if isint(mapid):
-                cmd = "show map #{}".format(mapid)
-            else:
-                cmd = "show map {}".format(mapid)
+            cmd = "show map " + _acl_map_ref(mapid)
         else:
             cmd = "show map"
-        map_info = cmd_across_all_procs(self._hap_processes, 'command',
-                                        cmd,
-                                        full_output=True)
         # map can't be different per process thus we only return the map
         # content found in 1st process.
-        map_info_proc1 = map_info[0][1]
+        map_info_proc1 = self._hap_processes[0].command(cmd, full_output=True)
 
-        if not check_output(map_info_proc1):
-            raise CommandFailed(map_info_proc1[0])
+        return _list_output(map_info_proc1)
 
-        if len(map_info_proc1) == 1 and not map_info_proc1[0]:
-            return []
-        else:
-            return map_info_proc1
+    def _static_info(self, name):
+        """Return a 'show info' field which is the same across all processes.
+
+        Values aren't kept beyond ``cache_ttl`` as a restart or a reload can
+        change them, for instance the version after an upgrade.
+
+        :param name: name of the field as reported by 'show info'.
+        :type name: ``string``
+        :rtype: ``string``
+        :raise: :class:`IncosistentData` exception if value is different
+          per process
+        """
+        values = cmd_across_all_procs(self._hap_processes, 'metric', name)
+
+        return compare_values(values)
 
     @property
     def uptime(self):
@@ -964,11 +1181,8 @@ class HAProxy(object):
           >>> hap.uptime
           '4d 0h16m26s'
         """
-        values = cmd_across_all_procs(self._hap_processes, 'metric',
-                                      'Uptime')
-
         # Just return the uptime of the 1st process
-        return values[0][1]
+        return self._hap_processes[0].metric('Uptime')
 
     @property
     def description(self):
@@ -983,10 +1197,7 @@ class HAProxy(object):
           >>> hap.description
           'test'
         """
-        values = cmd_across_all_procs(self._hap_processes, 'metric',
-                                      'description')
-
-        return compare_values(values)
+        return self._static_info('description')
 
     @property
     def nodename(self):
@@ -1001,10 +1212,7 @@ class HAProxy(object):
           >>> hap.nodename
           'test.foo.com'
         """
-        values = cmd_across_all_procs(self._hap_processes, 'metric',
-                                      'node')
-
-        return compare_values(values)
+        return self._static_info('node')
 
     @property
     def uptimesec(self):
@@ -1019,11 +1227,8 @@ class HAProxy(object):
           >>> hap.uptimesec
           346588
         """
-        values = cmd_across_all_procs(self._hap_processes, 'metric',
-                                      'Uptime_sec')
-
         # Just return the uptime of the 1st process
-        return values[0][1]
+        return self._hap_processes[0].metric('Uptime_sec')
 
     @property
     def releasedate(self):
@@ -1038,10 +1243,7 @@ class HAProxy(object):
           >>> hap.releasedate
           '2014/10/31'
         """
-        values = cmd_across_all_procs(self._hap_processes, 'metric',
-                                      'Release_date')
-
-        return compare_values(values)
+        return self._static_info('Release_date')
 
     @property
     def version(self):
@@ -1058,6 +1260,4 @@ class HAProxy(object):
         # If multiple version of HAProxy share the same socket directory
         # then this wil always raise IncosistentData exception.
         # TODO: Document this on README
-        values = cmd_across_all_procs(self._hap_processes, 'metric', 'Version')
-
-        return compare_values(values)
+        return self._static_info('Version')
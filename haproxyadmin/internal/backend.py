@@ -25,7 +25,7 @@ class _Backend:
     def __init__(self, hap_process, name, iid):
         self.hap_process = hap_process
         self._name = name
-        self.hap_process_nb = self.hap_process.process_nb
+        self.hap_process_nb = int(self.hap_process.process_nb)
         self._iid = iid
 
     @property
@@ -41,13 +41,27 @@ class _Backend:
 
         return self._iid
 
+    @property
+    def last_iid(self):
+        """Return the last known Proxy ID without querying HAProxy.
+
+        It may be stale if HAProxy was reloaded, callers must fall back to
+        a lookup by name, see :meth:`stats_data`.
+        """
+        return self._iid
+
+    @last_iid.setter
+    def last_iid(self, iid):
+        """Set the Proxy ID found by a lookup by name."""
+        self._iid = iid
+
     @property
     def process_nb(self):
         """Return the process number of the haproxy process
 
         :rtype: ``int``
         """
-        return int(self.hap_process_nb)
+        return self.hap_process_nb
 
     def stats_data(self):
         """Return stats data
@@ -109,7 +123,16 @@ class _Backend:
         servers = []
         return_list = []
 
-        servers = self.hap_process.servers_stats(self.name, self.iid)
+        # Use the last known iid rather than the iid property, which costs
+        # one more query to HAProxy, and fall back to a lookup by name when
+        # iid has changed, see stats_data().
+        try:
+            servers = self.hap_process.servers_stats(self.name, self._iid)
+        except KeyError:
+            data = self.hap_process.stats(obj_type=6)['backends'][self.name]
+            # remember the new iid, so next calls don't fall back again
+            self._iid = data['stats'].iid
+            servers = data['servers']
         if name is not None:
             if name in servers:
                 return_list.append(_Server(self,
@@ -26,7 +26,7 @@ class _Frontend:
     def __init__(self, hap_process, name, iid):
         self.hap_process = hap_process
         self._name = name
-        self.hap_process_nb = self.hap_process.process_nb
+        self.hap_process_nb = int(self.hap_process.process_nb)
         self._iid = iid
 
     @property
@@ -44,7 +44,7 @@ class _Frontend:
 
     @property
     def process_nb(self):
-        return int(self.hap_process_nb)
+        return self.hap_process_nb
 
     def stats_data(self):
         """Return stats data
@@ -89,7 +89,6 @@ class _Frontend:
 
         :return: A dictionary with statistics
         :rtype: ``dict``
-8. split internal to multiple files
         """
         data = self.stats_data()
         keys = data.heads
@@ -103,6 +102,18 @@ class _Frontend:
 
         return getattr(data, name)
 
+    def metrics(self, names):
+        """Return the values of several metrics with a single lookup.
+
+        :param names: metric names to retrieve
+        :type names: ``list``
+        :return: metric name as key and the value of the metric as value
+        :rtype: ``dict``
+        """
+        data = self.stats_data()
+
+        return dict((name, getattr(data, name)) for name in names)
+
     def command(self, cmd):
         """Run command to HAProxy
 
@@ -14,17 +14,25 @@ this class to send commands to HAProxy process.
 
 import socket
 import errno
+import random
+import threading
 import time
 import six
 
-from haproxyadmin.utils import (info2dict, stat2dict)
+from haproxyadmin.utils import (info2dict, stat2dict, monotonic)
 from haproxyadmin.exceptions import (SocketTransportError, SocketTimeout,
                                      SocketConnectionError)
 from haproxyadmin.internal.frontend import _Frontend
 from haproxyadmin.internal.backend import _Backend
 
+# Size of the buffer used for reading from the socket.
+BUFFER_SIZE = 65536
+# HAProxy terminates the output of every command with this string when the
+# CLI runs in interactive mode.
+PROMPT = b'\n> '
 
-class _HAProxyProcess:
+
+class _HAProxyProcess(object):
     """An object to a single HAProxy process.
 
     It acts as a communication pipe between the caller and individual
@@ -35,18 +43,48 @@ class _HAProxyProcess:
     :param retry: (optional) Number of connect retries (defaults to 3)
     :type retry: ``integer``
     :param retry_interval: (optional) Interval time in seconds between retries
-                           (defaults to 2)
+                           (defaults to 2), it is doubled after every retry
+                           and a random jitter of up to 50% is subtracted
+    :type retry_interval: ``integer``
     :param timeout: timeout for the connection
     :type timeout: ``float``
-    :type retry_interval: ``integer``
+    :param max_backoff: (optional) Maximum interval time in seconds between
+      retries (defaults to 30)
+    :type max_backoff: ``integer``
+    :param keep_alive: (optional) Keep connections to the socket open and
+      reuse them for all commands (defaults to False)
+    :type keep_alive: ``bool``
+    :param pool_size: (optional) Maximum number of idle connections to keep
+      open when keep_alive is True (defaults to 1)
+    :type pool_size: ``integer``
+    :param cache_ttl: (optional) seconds to cache the output of 'show info'
+      for, 0 disables caching (defaults to 0)
+    :type cache_ttl: ``float``
     """
-    def __init__(self, socket_file, retry=3, retry_interval=2, timeout=1):
+    __slots__ = ('socket_file', 'hap_stats', 'hap_info', 'retry',
+                 'retry_interval', 'max_backoff', 'timeout', 'keep_alive',
+                 'pool_size', 'cache_ttl', '_pool', '_pool_lock', '_info',
+                 'process_nb')
+
+    def __init__(self, socket_file, retry=3, retry_interval=2, timeout=1,
+                 keep_alive=False, pool_size=1, max_backoff=30, cache_ttl=0):
         self.socket_file = socket_file
         self.hap_stats = {}
         self.hap_info = {}
         self.retry = retry
         self.retry_interval = retry_interval
+        self.max_backoff = max_backoff
         self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.pool_size = pool_size
+        self.cache_ttl = cache_ttl
+        # idle persistent connections, used only when keep_alive is True.
+        # The first command below opens one, so the pool isn't empty when
+        # the caller sends its first command.
+        self._pool = []
+        self._pool_lock = threading.Lock()
+        # a tuple of the time 'show info' was run and its parsed output
+        self._info = None
         # process number associated with this object
         self.process_nb = self.metric('Process_num')
 
@@ -63,6 +101,36 @@ class _HAProxyProcess:
         :return: 1st line of the output or the whole output as a list
         :rtype: ``string`` or ``list`` if full_output is True
         """
+        if self.keep_alive:
+            data = self._retry(self._send_keep_alive, [command])[0]
+        else:
+            data = self._retry(self._send, command)
+
+        # HAProxy always send an empty string at the end
+        # we remove it as it adds noise for things like ACL/MAP and etc
+        # We only do that when we get more than 1 line, which only
+        # happens when we ask for ACL/MAP/etc and not for giving cmds
+        # such as disable/enable server
+        if len(data) > 1 and data[-1] == '':
+            data.pop()
+
+        if data:
+            if full_output:
+                return data
+            else:
+                return data[0]
+        else:
+            raise ValueError("no data returned from socket {}".format(
+                self.socket_file))
+
+    def _retry(self, send, command):
+        """Call a function which talks to HAProxy and retry on failures.
+
+        :param send: function to call
+        :type send: ``function``
+        :param command: argument to pass to the function
+        :return: what the function returned
+        """
         data = []  # hold data returned from socket
         raised = None  # hold possible exception raised during connect phase
         attempt = 0 # times to attempt to connect after a connection failure
@@ -75,14 +143,10 @@ class _HAProxyProcess:
         else:
             # any other value means retry N times
             attempt = self.retry + 1
+        retries = 0  # times we have retried so far
         while attempt != 0:
             try:
-                unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                unix_socket.settimeout(self.timeout)
-                unix_socket.connect(self.socket_file)
-                unix_socket.send(six.b(command + '\n'))
-                file_handle = unix_socket.makefile()
-                data = file_handle.read().splitlines()
+                data = send(command)
             except socket.timeout:
                 raised = SocketTimeout(socket_file=self.socket_file)
             except OSError as exc:
@@ -98,43 +162,304 @@ class _HAProxyProcess:
                     # for the rest of OSError exceptions just reraise them
                     raised = exc
             else:
-                # HAProxy always send an empty string at the end
-                # we remove it as it adds noise for things like ACL/MAP and etc
-                # We only do that when we get more than 1 line, which only
-                # happens when we ask for ACL/MAP/etc and not for giving cmds
-                # such as disable/enable server
-                if len(data) > 1 and data[-1] == '':
-                    data.pop()
                 # make sure possible previous errors are cleared
                 raised = None
                 # get out from the retry loop
                 break
             finally:
-                unix_socket.close()
-                if raised:
-                    time.sleep(self.retry_interval)
+                # there is no point to wait after the last attempt
+                if raised and attempt != 1:
+                    time.sleep(self._backoff(retries))
 
             attempt -= 1
+            retries += 1
 
         if raised:
             raise raised
-        elif data:
-            if full_output:
-                return data
-            else:
-                return data[0]
+
+        return data
+
+    def _backoff(self, retries):
+        """Return the time to sleep before the next retry.
+
+        Exponential backoff with jitter, so clients which failed at the same
+        time, for instance while HAProxy was reloading, don't retry at the
+        same time.
+
+        :param retries: number of retries so far
+        :type retries: ``integer``
+        :rtype: ``float``
+        """
+        # cap the exponent as well, retry can be 0 which means retry forever
+        interval = min(self.retry_interval * 2 ** min(retries, 32),
+                       self.max_backoff)
+
+        return interval * (0.5 + random.random() * 0.5)
+
+    def commands(self, commands):
+        """Send several commands to HAProxy.
+
+        With keep_alive all commands are written at once, one per line, over
+        a single connection and the output of each command is read up to its
+        prompt. Otherwise, each command is sent over its own connection, as
+        concatenating them with ';' leaves only the empty line HAProxy sends
+        after every output to split the output per command, and commands
+        such as 'show errors' print empty lines as part of their output.
+
+        .. note::
+            HAProxy splits a command which contains ';' into several
+            commands, their output is returned as the output of one command.
+
+        :param commands: valid commands to execute
+        :type commands: ``list``
+        :return: the output of each command as a list of lines, in the order
+          of ``commands``
+        :rtype: ``list``
+        :raise: ``ValueError`` when keep_alive is True and a command contains
+          a newline character
+        """
+        commands = list(commands)
+        if not commands:
+            return []
+
+        if self.keep_alive:
+            outputs = self._retry(self._send_keep_alive, commands)
+            for output in outputs:
+                # drop the empty line HAProxy sends after every output
+                if output and output[-1] == '':
+                    output.pop()
+
+            return outputs
+
+        outputs = []
+        for command in commands:
+            output = self.command(command, full_output=True)
+            # command() keeps the empty line of commands without output
+            if output == ['']:
+                output = []
+            outputs.append(output)
+
+        return outputs
+
+    def _send(self, command):
+        """Send a command over a new connection, which is closed afterwards.
+
+        :param command: A valid command to execute
+        :type command: string
+        :return: the output of the command
+        :rtype: ``list``
+        """
+        unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            unix_socket.settimeout(self.timeout)
+            unix_socket.connect(self.socket_file)
+            unix_socket.sendall(six.b(command + '\n'))
+            # HAProxy closes the connection after the output is sent, read
+            # raw bytes until then and decode them once.
+            chunks = []
+            while True:
+                chunk = unix_socket.recv(BUFFER_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            unix_socket.close()
+
+        data = b''.join(chunks)
+        if not isinstance(data, str):
+            data = data.decode()
+
+        return data.splitlines()
+
+    def _send_keep_alive(self, commands):
+        """Send commands over a persistent connection.
+
+        An idle connection is taken from the pool or a new one is opened
+        and the CLI of HAProxy is switched to interactive mode, so the
+        connection stays open after a command is executed. HAProxy closes
+        idle connections after ``stats timeout``, thus a failure on a reused
+        connection is retried once over a new connection.
+
+        A command which contains a newline character is rejected, as HAProxy
+        runs every line as a separate command and the output of the extra
+        command would be returned for the next command sent over the
+        connection.
+
+        :param commands: valid commands to execute
+        :type commands: ``list``
+        :return: the output of each command as a list of lines
+        :rtype: ``list``
+        :raise: ``ValueError`` when a command contains a newline character
+        """
+        for command in commands:
+            if '\n' in command:
+                raise ValueError("command contains a newline character: "
+                                 "{!r}".format(command))
+
+        unix_socket = self._acquire()
+        reused = unix_socket is not None
+        try:
+            if not reused:
+                unix_socket = self._connect()
+            data, trailing = self._request(unix_socket, commands)
+        except socket.timeout:
+            self._discard(unix_socket)
+            raise
+        except socket.error:
+            self._discard(unix_socket)
+            if not reused:
+                raise
+            unix_socket = None
+            try:
+                unix_socket = self._connect()
+                data, trailing = self._request(unix_socket, commands)
+            except socket.error:
+                self._discard(unix_socket)
+                raise
+
+        if trailing:
+            # output we didn't ask for would be returned to the next command
+            self._discard(unix_socket)
         else:
-            raise ValueError("no data returned from socket {}".format(
-                self.socket_file))
+            self._release(unix_socket)
+
+        return data
+
+    def _acquire(self):
+        """Return an idle connection from the pool or None if it is empty."""
+        with self._pool_lock:
+            if self._pool:
+                return self._pool.pop()
+
+        return None
+
+    def _release(self, unix_socket):
+        """Return a connection to the pool or close it if the pool is full."""
+        with self._pool_lock:
+            if len(self._pool) < self.pool_size:
+                self._pool.append(unix_socket)
+                return
+
+        unix_socket.close()
+
+    @staticmethod
+    def _discard(unix_socket):
+        """Close a broken connection."""
+        if unix_socket is not None:
+            unix_socket.close()
+
+    def _connect(self):
+        """Open a persistent connection and switch to interactive mode.
+
+        :rtype: ``socket.socket``
+        """
+        unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            unix_socket.settimeout(self.timeout)
+            unix_socket.connect(self.socket_file)
+            unix_socket.sendall(b'prompt\n')
+            _, trailing = self._read_responses(unix_socket, 1)
+            if trailing:
+                raise socket.error(errno.EPROTO,
+                                   'unexpected output from HAProxy')
+        except socket.error:
+            unix_socket.close()
+            raise
+
+        return unix_socket
+
+    def _request(self, unix_socket, commands):
+        """Send commands over an open persistent connection.
+
+        All commands are written before any output is read, so they cost a
+        single round trip.
+
+        :param unix_socket: connection in interactive mode
+        :type unix_socket: ``socket.socket``
+        :param commands: valid commands to execute
+        :type commands: ``list``
+        :return: a tuple of the output of each command as a list of lines
+          and ``True`` if more data than requested was read
+        :rtype: ``tuple``
+        """
+        unix_socket.sendall(six.b(''.join(x + '\n' for x in commands)))
+        responses, trailing = self._read_responses(unix_socket, len(commands))
+        outputs = []
+        for data in responses:
+            if not isinstance(data, str):
+                data = data.decode()
+            outputs.append(data.splitlines())
+
+        return outputs, trailing
+
+    @staticmethod
+    def _read_responses(unix_socket, count):
+        """Read the output of commands, each one up to its prompt.
+
+        :param unix_socket: connection in interactive mode
+        :type unix_socket: ``socket.socket``
+        :param count: number of outputs to read
+        :type count: ``integer``
+        :return: a tuple of the output of each command without the prompt,
+          which is the same output HAProxy returns in non-interactive mode,
+          and ``True`` if data was read after the last prompt, in which case
+          the connection can't be reused.
+        :rtype: ``tuple``
+        """
+        responses = []
+        if count == 0:
+            # HAProxy sends nothing, waiting for a prompt would time out
+            return responses, False
+
+        buf = bytearray()
+        start = 0  # where the output of the next command starts
+        while True:
+            # look for the prompt in new data only, it may span two reads
+            pos = max(start, len(buf) - len(PROMPT))
+            chunk = unix_socket.recv(BUFFER_SIZE)
+            if not chunk:
+                raise socket.error(errno.ECONNRESET,
+                                   'connection closed by HAProxy')
+            buf.extend(chunk)
+            while True:
+                end = buf.find(PROMPT, pos)
+                if end == -1:
+                    break
+                # strip '> ' and keep the newline, which ends the output
+                responses.append(bytes(buf[start:end + 1]))
+                start = pos = end + len(PROMPT)
+                if len(responses) == count:
+                    return responses, start != len(buf)
+
+    def close(self):
+        """Close all idle persistent connections."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+
+        for unix_socket in pool:
+            unix_socket.close()
 
     def proc_info(self):
         """Return a dictionary containing information about HAProxy daemon.
 
+        The dictionary is cached for ``cache_ttl`` seconds and it is shared
+        between callers, so it must not be modified.
+
         :rtype: dictionary, see utils.info2dict() for details
         """
-        raw_info = self.command('show info', full_output=True)
+        now = monotonic()
+        cached = self._info
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        info = info2dict(self.command('show info', full_output=True))
+        self._info = (now, info)
 
-        return info2dict(raw_info)
+        return info
+
+    def invalidate(self):
+        """Clear the cached output of 'show info'."""
+        self._info = None
 
     def stats(self, iid=-1, obj_type=-1, sid=-1):
         """Return a nested dictionary containing backend information.
@@ -167,6 +492,17 @@ class _HAProxyProcess:
     def metric(self, name):
         return self.proc_info()[name]
 
+    def pid(self):
+        """Return the process ID of HAProxy process.
+
+        PID is read from the output of 'show info', which is cached for
+        ``cache_ttl`` seconds, as a reload changes it while the socket file
+        can stay in place.
+
+        :rtype: ``string``
+        """
+        return self.metric('Pid')
+
     def backends_stats(self, iid=-1):
         """Build the data structure for backends
 
@@ -47,10 +47,11 @@ class _Server:
 
         :rtype: ``utils.CSVLine`` object
         """
-        # Fetch data using the last known sid
+        # Fetch data using the last known sid and the last known iid of the
+        # backend, as the iid property of backend queries HAProxy as well.
         try:
             data = self.backend.hap_process.servers_stats(
-                self.backend.name, self.backend.iid, self._sid)[self.name]
+                self.backend.name, self.backend.last_iid, self._sid)[self.name]
         except KeyError:
             # A lookup on HAProxy with the current id doesn't return
             # an object with our name.
@@ -64,6 +65,10 @@ class _Server:
                 # This occurs when object was removed from configuration
                 # and haproxy was reloaded.We cant recover from this situation.
                 raise
+            # remember the new ids, so next calls don't fall back again.
+            # iid of a server line is the proxy ID of its backend.
+            self._sid = data.sid
+            self.backend.last_iid = data.iid
 
         return data
 
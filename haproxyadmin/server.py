@@ -69,6 +69,7 @@ SERVER_METRICS = [
     'wredis',
     'wretr',
 ]
+SERVER_METRICS_SET = frozenset(SERVER_METRICS)
 
 
 class Server:
@@ -249,13 +250,20 @@ class Server:
         :rtype: number, integer
         :raise: ``ValueError`` when a given metric is not found
         """
-        if name not in SERVER_METRICS:
+        if name not in SERVER_METRICS_SET:
             raise ValueError("{} is not valid metric".format(name))
 
-        metrics = [x.metric(name) for x in self._server_per_proc]
-        # num_metrics = filter(None, map(converter, metrics))
-        metrics[:] = (converter(x) for x in metrics)
-        metrics[:] = (x for x in metrics if x is not None)
+        return self._metric_unchecked(name)
+
+    def _metric_unchecked(self, name):
+        """Return the value of a metric without validating its name.
+
+        Used by properties which pass a metric name known to be valid.
+        """
+        values = cmd_across_all_procs(self._server_per_proc, 'metric', name)
+        _converter = converter
+        metrics = [x for x in (_converter(y[1]) for y in values)
+                   if x is not None]
 
         return calculate(name, metrics)
 
@@ -275,7 +283,7 @@ class Server:
         :rtype: ``integer``
 
         """
-        return self.metric('stot')
+        return self._metric_unchecked('stot')
 
     def requests_per_process(self):
         """Return the number of requests for the server per process.
@@ -9,17 +9,34 @@ haproxyadmin.
 
 """
 
+import glob
 import socket
 import os
 import stat
+import threading
 from functools import wraps
+from multiprocessing.pool import ThreadPool
 import six
-import re
+try:
+    from sys import intern
+except ImportError:
+    # Python 2 provides intern() as a builtin.
+    pass
+try:
+    from os import scandir as _scandir
+except ImportError:
+    # os.scandir() was added in Python 3.5.
+    _scandir = None
+try:
+    from time import monotonic
+except ImportError:
+    # Python 2 doesn't provide a monotonic clock.
+    from time import time as monotonic
 
 from haproxyadmin.exceptions import (CommandFailed, MultipleCommandResults,
                                      IncosistentData)
-from haproxyadmin.command_status import (ERROR_OUTPUT_STRINGS,
-        SUCCESS_OUTPUT_STRINGS, SUCCESS_STRING_PORT, SUCCESS_STRING_ADDRESS)
+from haproxyadmin.command_status import (classify, OUTPUT_ERROR,
+        OUTPUT_SUCCESS, SUCCESS_PORT_RE, SUCCESS_ADDRESS_RE)
 
 METRICS_SUM = [
     'CompressBpsIn',
@@ -114,6 +131,19 @@ METRICS_AVG = [
     'ttime',
     'weight',
 ]
+METRICS_SUM_SET = frozenset(METRICS_SUM)
+METRICS_AVG_SET = frozenset(METRICS_AVG)
+
+# Maximum number of threads used for talking to HAProxy processes in parallel.
+MAX_WORKERS = 32
+
+_POOL = None
+_POOL_PID = None
+# number of threads of the pool and number of calls which use it
+_POOL_SIZE = 0
+_POOL_USERS = 0
+_POOL_LOCK = threading.Lock()
+_WORKER = threading.local()
 
 
 def should_die(old_implementation):
@@ -176,33 +206,192 @@ def connected_socket(path, timeout):
       otherwise
     :rtype: ``bool``
     """
+    unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
-        unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         unix_socket.settimeout(timeout)
         unix_socket.connect(path)
-        unix_socket.send(six.b('show info' + '\n'))
-        file_handle = unix_socket.makefile()
+        unix_socket.sendall(six.b('show info' + '\n'))
+        # read raw bytes until HAProxy closes the connection and decode
+        # them once, rather than through a text file object.
+        chunks = []
+        while True:
+            chunk = unix_socket.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
     except (socket.timeout, OSError):
         return False
-    else:
-        try:
-            data = file_handle.read().splitlines()
-        except (socket.timeout, OSError):
-            return False
-        else:
-            hap_info = info2dict(data)
     finally:
         unix_socket.close()
 
+    data = b''.join(chunks)
+    if not isinstance(data, str):
+        data = data.decode()
+    hap_info = info2dict(data.splitlines())
+
     try:
         return hap_info['Name'] in ['HAProxy', 'hapee-lb']
     except KeyError:
         return False
 
 
+def unix_sockets(directory):
+    """Return the paths of UNIX sockets found in a directory.
+
+    Hidden files are ignored. ``os.scandir()`` is used when it is available
+    as it reports regular files and directories without calling ``stat()``,
+    so only the remaining entries are checked with ``stat()``.
+
+    A socket is returned only once even when symlinks to it are also found
+    in the directory, otherwise commands would be sent twice to the same
+    HAProxy process and its metrics would be counted twice.
+
+    :param directory: directory path
+    :type directory: ``string``
+    :rtype: ``list``
+    """
+    paths = []
+    seen = set()
+
+    def _add(path, stat_result):
+        if stat.S_ISSOCK(stat_result.st_mode):
+            inode = (stat_result.st_dev, stat_result.st_ino)
+            if inode not in seen:
+                seen.add(inode)
+                paths.append(path)
+
+    if _scandir is None:
+        for path in glob.glob(os.path.join(directory, '*')):
+            try:
+                _add(path, os.stat(path))
+            except OSError:
+                # file was removed or is a broken symlink
+                pass
+
+        return paths
+
+    for entry in _scandir(directory):
+        try:
+            if (entry.name.startswith('.') or entry.is_file()
+                    or entry.is_dir()):
+                continue
+            _add(entry.path, entry.stat())
+        except OSError:
+            # file was removed or is a broken symlink
+            pass
+
+    return paths
+
+
+def connected_sockets(paths, timeout):
+    """Return the paths of valid HAProxy socket files.
+
+    Each path is checked with :func:`connected_socket` and all of them are
+    checked in parallel, so the time it takes doesn't grow with the number
+    of files when some of them are stale and the connection times out.
+
+    :param paths: UNIX socket file paths
+    :type paths: ``list``
+    :param timeout: timeout for the connection, in seconds
+    :type timeout: ``float``
+    :return: paths of valid HAProxy stats socket files, the order of
+      ``paths`` is preserved.
+    :rtype: ``list``
+    """
+    def _check(path):
+        return connected_socket(path, timeout)
+
+    results = _parallel_map(_check, paths)
+
+    return [path for path, valid in zip(paths, results) if valid]
+
+
+def _mark_worker():
+    """Flag the current thread as a worker of the thread pool."""
+    _WORKER.active = True
+
+
+def _acquire_pool(size):
+    """Return the thread pool used for talking to HAProxy processes.
+
+    The pool is created on first use with as many threads as needed, capped
+    at :data:`MAX_WORKERS`, rather than starting all of them for the 1 or
+    2 processes most setups run. It is replaced by a larger one when more
+    threads are needed and no call uses it, otherwise the call runs with
+    the threads there are. It is recreated in a child process after a fork
+    as worker threads don't survive a fork.
+
+    Every call must be paired with a call to :func:`_release_pool`.
+
+    :param size: number of threads wanted.
+    :type size: ``integer``
+    :rtype: :class:`multiprocessing.pool.ThreadPool`
+    """
+    global _POOL, _POOL_PID, _POOL_SIZE, _POOL_USERS
+    size = min(size, MAX_WORKERS)
+    pid = os.getpid()
+    with _POOL_LOCK:
+        if _POOL_PID != pid:
+            # the pool of the parent process, if any, is unusable
+            _POOL = None
+            _POOL_USERS = 0
+        if _POOL is None or (_POOL_SIZE < size and _POOL_USERS == 0):
+            if _POOL is not None:
+                # nobody uses it, its threads exit once it is closed
+                _POOL.close()
+            _POOL = ThreadPool(size, initializer=_mark_worker)
+            _POOL_PID = pid
+            _POOL_SIZE = size
+        _POOL_USERS += 1
+
+        return _POOL
+
+
+def _release_pool():
+    """Mark the end of a call which got the pool from :func:`_acquire_pool`."""
+    global _POOL_USERS
+    with _POOL_LOCK:
+        if _POOL_PID == os.getpid() and _POOL_USERS > 0:
+            _POOL_USERS -= 1
+
+
+def _parallel_map(func, items):
+    """Call a function for all items in parallel and return the results.
+
+    :param func: function which accepts a single argument.
+    :type func: ``function``
+    :param items: arguments to pass to the function, one per call.
+    :type items: ``list``
+    :return: the results in the order of ``items``.
+    :rtype: ``list``
+    """
+    # There is nothing to parallelize for a single item, and we never
+    # submit work from a worker thread as it can deadlock a saturated pool.
+    if len(items) < 2 or getattr(_WORKER, 'active', False):
+        return [func(item) for item in items]
+
+    pool = _acquire_pool(len(items))
+    try:
+        return pool.map(func, items)
+    finally:
+        _release_pool()
+
+
 def cmd_across_all_procs(hap_objects, method, *arg, **kargs):
     """Return the result of a command executed in all HAProxy process.
 
+    Each HAProxy process is queried over its own UNIX socket, thus the
+    method is called for all objects in parallel using a pool of threads.
+    Order of the returned list follows the order of ``hap_objects``.
+    A process that doesn't respond delays the result by the timeout of its
+    socket only once, regardless the number of processes.
+
+    .. note::
+        All results are collected before they are returned, even when one
+        of them is an error. A command, which changes settings, can't be
+        cancelled after it is sent, and returning early would hide the
+        processes on which it was applied.
+
     .. note::
         Objects must have a property with the name 'process_nb' which
         returns the HAProxy process number.
@@ -217,13 +406,41 @@ def cmd_across_all_procs(hap_objects, method, *arg, **kargs):
 
     :rtype: ``list``
     """
-    results = []
-    for obj in hap_objects:
-        results.append(
-            (getattr(obj, 'process_nb'), getattr(obj, method)(*arg, **kargs))
-        )
+    def _run(obj):
+        return (getattr(obj, 'process_nb'), getattr(obj, method)(*arg, **kargs))
+
+    return _parallel_map(_run, hap_objects)
+
+
+def ttl_cached(cache, key, ttl, fetch):
+    """Return a value from a cache, fetching it when it has expired.
+
+    Entries of the cache are tuples of the time a value was fetched and the
+    value itself. The time is taken before the value is fetched, so the
+    value never outlives ``ttl`` seconds from the moment it was requested.
+
+    :param cache: a dictionary which holds the cached values.
+    :type cache: ``dict``
+    :param key: key of the value in the cache.
+    :param ttl: seconds to keep the value for, 0 disables caching.
+    :type ttl: ``float``
+    :param fetch: a function without arguments which returns the value.
+    :type fetch: ``function``
+    :return: what ``fetch`` returned now or at most ``ttl`` seconds ago.
+    """
+    now = monotonic()
+    try:
+        timestamp, value = cache[key]
+    except KeyError:
+        pass
+    else:
+        if now - timestamp < ttl:
+            return value
+
+    value = fetch()
+    cache[key] = (now, value)
 
-    return results
+    return value
 
 
 def elements_of_list_same(iterator):
@@ -270,10 +487,17 @@ def compare_values(values):
     :rtype: ``string``
     :raise: :class:`.IncosistentData`.
     """
-    if elements_of_list_same([msg[1] for msg in values]):
-        return values[0][1]
-    else:
-        raise IncosistentData(values)
+    # Values are the same in the common case, so compare them with the 1st
+    # one rather than building a set, and stop at the first difference.
+    if values:
+        first = values[0][1]
+        for _, value in values:
+            if value != first:
+                break
+        else:
+            return first
+
+    raise IncosistentData(values)
 
 
 def check_output(output):
@@ -293,7 +517,7 @@ def check_output(output):
     # We only care about the 1st line as that one contains possible error
     # message
     first_line = output[0]
-    if first_line in ERROR_OUTPUT_STRINGS:
+    if classify(first_line) == OUTPUT_ERROR:
         return False
     else:
         return True
@@ -320,7 +544,7 @@ def check_command(results):
     """
     if elements_of_list_same([msg[1] for msg in results]):
         msg = results[0][1]
-        if msg in SUCCESS_OUTPUT_STRINGS:
+        if classify(msg) == OUTPUT_SUCCESS:
             return True
         else:
             raise CommandFailed(msg)
@@ -352,15 +576,15 @@ def check_command_addr_port(change_type, results):
       :class:`ValueError`.
     """
     if change_type == 'addr':
-        _match = SUCCESS_STRING_ADDRESS
+        _match = SUCCESS_ADDRESS_RE
     elif change_type == 'port':
-        _match = SUCCESS_STRING_PORT
+        _match = SUCCESS_PORT_RE
     else:
         raise ValueError('invalid value for change_type')
 
     if elements_of_list_same([msg[1] for msg in results]):
         msg = results[0][1]
-        if re.match(_match, msg):
+        if _match.match(msg):
             return True
         else:
             raise CommandFailed(msg)
@@ -384,9 +608,9 @@ def calculate(name, metrics):
     if not metrics:
         return 0
 
-    if name in METRICS_SUM:
+    if name in METRICS_SUM_SET:
         return sum(metrics)
-    elif name in METRICS_AVG:
+    elif name in METRICS_AVG_SET:
         return int(sum(metrics)/len(metrics))
     else:
         # This is to catch the case where the caller forgets to check if
@@ -402,6 +626,10 @@ def isint(value):
     :rtype: ``bool``
     :raise: :class:`ValueError` when value can't be converted to an integer
     """
+    # IDs are usually passed as integers, avoid the exception handling.
+    if isinstance(value, int):
+        return True
+
     try:
         int(value)
         return True
@@ -447,16 +675,24 @@ def converter(value):
       'UP 1/2'
       >>>
     """
+    # Most metrics are integers, convert them directly as it is faster than
+    # going through float() and keeps large counters, such as bytes in/out,
+    # precise.
     try:
-        return int(float(value))
+        return int(value)
     except ValueError:
-        # if it isn't an empty string return it otherwise return None
-        return value.strip() or None
+        pass
     except TypeError:
         # This is to catch the case where input value is a data structure or
         # object. It is very unlikely someone to pass those, but you never know.
         return None
 
+    try:
+        return int(float(value))
+    except ValueError:
+        # if it isn't an empty string return it otherwise return None
+        return value.strip() or None
+
 
 class CSVLine(object):
     """An object that holds field/value of a CSV line.
@@ -466,6 +702,9 @@ class CSVLine(object):
 
     :param parts: A list with field values
     :type parts: list
+    :param heads: (optional) A list with field names, defaults to the
+      field names set on the class.
+    :type heads: list
 
     Usage::
 
@@ -490,8 +729,12 @@ class CSVLine(object):
     # This holds the field names of the CSV
     heads = []
 
-    def __init__(self, parts):
+    def __init__(self, parts, heads=None):
         self.parts = parts
+        # Outputs of several HAProxy processes can be parsed concurrently,
+        # so each object can carry the field names of its own output.
+        if heads is not None:
+            self.heads = heads
 
     def __getattr__(self, attr):
         _index = self.heads.index(attr)
@@ -536,10 +779,11 @@ def info2dict(raw_info):
     """
     info = {}
     for line in raw_info:
-        line = line.lstrip()
-        if ': ' in line:
-            key, value = line.split(': ', 1)
-            info[key] = value
+        # partition() scans the line once, unlike a membership test
+        # followed by split()
+        key, sep, value = line.lstrip().partition(': ')
+        if sep:
+            info[intern(key)] = value
 
     return info
 
@@ -581,8 +825,9 @@ def stat2dict(csv_data):
 
     # get the header line
     headers = csv_data.pop(0)
-    # make a shiny list of heads
-    heads = headers[2:].strip().split(',')
+    # make a shiny list of heads, field names are the same for every call
+    # thus intern them to share a single copy across all parsed outputs
+    heads = [intern(x) for x in headers[2:].strip().split(',')]
     # set for all _CSVLine object the header fields
     CSVLine.heads = heads
 
@@ -610,34 +855,35 @@ def stat2dict(csv_data):
     #     <backend_name>,BACKEND,....
     # NOTE: we can have a single line for a backend definition without any
     # lines for servers associated with for that backend
+    frontends = dicts['frontends']
+    backends = dicts['backends']
     for line in csv_data:
         line = line.strip()
         if line:
             # make list of parts
             parts = line.split(',')
             # each line is a distinct object
-            csvline = CSVLine(parts)
-            # parts[0] => pxname field, backend or frontend name
-            # parts[1] => svname field, servername or BACKEND or FRONTEND
-            if parts[1] == 'FRONTEND':
+            csvline = CSVLine(parts, heads)
+            # pxname field, backend or frontend name
+            # svname field, servername or BACKEND or FRONTEND
+            pxname = parts[0]
+            svname = parts[1]
+            if svname == 'FRONTEND':
                 # This is a frontend line.
                 # Frontend definitions aren't spread across multiple lines.
-                dicts['frontends'][parts[0]] = csvline
-            elif (parts[1] == 'BACKEND' and parts[0] not in dicts['backends']):
-                # I see this backend information for 1st time.
-                dicts['backends'][parts[0]] = {}
-                dicts['backends'][parts[0]]['servers'] = {}
-                dicts['backends'][parts[0]]['stats'] = csvline
+                frontends[pxname] = csvline
+                continue
+
+            try:
+                backend = backends[pxname]
+            except KeyError:
+                # I see this backend for 1st time, either its BACKEND line or
+                # a line with server information, thus create the backend
+                # structure.
+                backend = backends[pxname] = {'servers': {}}
+            if svname == 'BACKEND':
+                backend['stats'] = csvline
             else:
-                if parts[0] not in dicts['backends']:
-                    # This line holds server information for a backend I haven't
-                    # seen before, thus create the backend structure and store
-                    # server details.
-                    dicts['backends'][parts[0]] = {}
-                    dicts['backends'][parts[0]]['servers'] = {}
-                if parts[1] == 'BACKEND':
-                    dicts['backends'][parts[0]]['stats'] = csvline
-                else:
-                    dicts['backends'][parts[0]]['servers'][parts[1]] = csvline
+                backend['servers'][svname] = csvline
 
     return dicts